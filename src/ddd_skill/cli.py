@@ -1,36 +1,182 @@
 """CLI for installing DDD skills to Claude Code."""
 
-import argparse
-import shutil
+import functools
+import os
+import re
 import sys
 from pathlib import Path
 
-# For Python 3.9+, use importlib.resources
-try:
-    from importlib.resources import files
-except ImportError:
-    # Fallback for Python < 3.9
-    from importlib_resources import files  # type: ignore
 
-# Get skills directory from package resources
-SOURCE_SKILLS_DIR = Path(str(files("ddd_skill").joinpath("skills")))
+# Paths are computed lazily so that --help and other paths that never
+# touch the filesystem don't pay the resource-lookup/getcwd syscalls
+# at import time.
+@functools.cache
+def _source_skills_dir() -> Path:
+    """Get skills directory from package resources."""
+    # importlib.resources drags in tempfile/shutil, so defer it too
+    # (Python 3.9+; importlib_resources is the pre-3.9 fallback)
+    try:
+        from importlib.resources import files
+    except ImportError:
+        from importlib_resources import files  # type: ignore
 
-GLOBAL_SKILL_DIR = Path.home() / ".claude" / "skills"
-LOCAL_SKILL_DIR = Path.cwd() / ".claude" / "skills"
+    return Path(str(files("ddd_skill").joinpath("skills")))
 
 
-def get_available_skills() -> list[Path]:
-    """Get list of available skill directories from the project."""
-    if not SOURCE_SKILLS_DIR.exists():
-        return []
+@functools.cache
+def _global_skill_dir() -> Path:
+    return Path.home() / ".claude" / "skills"
 
-    # Find all subdirectories that contain SKILL.md
+
+@functools.cache
+def _local_skill_dir() -> Path:
+    return Path.cwd() / ".claude" / "skills"
+
+
+@functools.cache
+def get_available_skills() -> tuple[Path, ...]:
+    """Get the available skill directories from the project.
+
+    Cached per process (use ``get_available_skills.cache_clear()`` in
+    tests); returns a tuple so the cached value stays immutable.
+    """
+    # Find all subdirectories that contain SKILL.md; scandir reuses the
+    # directory entry's cached file type instead of stat-ing each item.
     skills = []
-    for item in SOURCE_SKILLS_DIR.iterdir():
-        if item.is_dir() and (item / "SKILL.md").exists():
-            skills.append(item)
+    try:
+        with os.scandir(_source_skills_dir()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and os.path.exists(
+                    os.path.join(entry.path, "SKILL.md")
+                ):
+                    skills.append(Path(entry.path))
+    except FileNotFoundError:
+        return ()
+
+    return tuple(sorted(skills))
+
+
+def _fastcopy(src: str, dst: str, *, follow_symlinks: bool = True) -> str:
+    """Copy a file like shutil.copy2 but with a 1 MiB buffer.
+
+    shutil's default 64 KiB buffer issues far more read/write syscalls
+    than needed for large reference assets bundled with a skill.
+    """
+    import shutil
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        shutil.copyfileobj(fsrc, fdst, length=1024 * 1024)
+    shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+    return dst
+
+
+def _copy_reflink(src: str, dst: str, *, follow_symlinks: bool = True) -> str:
+    """Copy a file with os.copy_file_range, falling back to _fastcopy.
+
+    copy_file_range stays in the kernel (no userspace buffer), reflinks
+    on CoW filesystems like btrfs/xfs, and does server-side copies on
+    NFS. Not every filesystem supports it, so any OSError falls back to
+    the buffered copy.
+    """
+    import shutil
+
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            while os.copy_file_range(
+                fsrc.fileno(), fdst.fileno(), 1024 * 1024 * 1024
+            ):
+                pass
+    except OSError:
+        return _fastcopy(src, dst, follow_symlinks=follow_symlinks)
+    shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+    return dst
+
+
+_copy_function = _copy_reflink if hasattr(os, "copy_file_range") else _fastcopy
+
+# Marker file recording the source tree fingerprint of the last install
+_FINGERPRINT_FILE = ".install_fingerprint"
+
+
+def _fingerprint(root: Path) -> list:
+    """Fingerprint a skill tree as sorted (relpath, size, mtime_ns) rows."""
+    # Iterative scandir walk: one stat per entry from the cached dir
+    # entry, no Path construction or re-stat per file as with rglob
+    prefix = len(os.fspath(root)) + 1
+    rows = []
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    st = entry.stat(follow_symlinks=False)
+                    rows.append([entry.path[prefix:], st.st_size, st.st_mtime_ns])
+    rows.sort()
+    return rows
+
+
+def _install_one(skill_path: Path, target_dir: Path) -> str:
+    """Copy a single skill into target_dir and return its name."""
+    import json
+    import shutil
+
+    skill_name = skill_path.name
+    target_skill_dir = target_dir / skill_name
+
+    fingerprint = _fingerprint(skill_path)
+    marker = target_skill_dir / _FINGERPRINT_FILE
+
+    # Skip the copy entirely when the source tree is unchanged since
+    # the last install.
+    try:
+        if json.loads(marker.read_text(encoding="utf-8")) == fingerprint:
+            return skill_name
+    except (OSError, ValueError):
+        pass
+
+    # Overwrite in place: dirs_exist_ok skips the rmtree round-trip and
+    # unchanged files keep their inodes, which lets copy_file_range
+    # reflink on CoW filesystems.
+    existing = _fingerprint(target_skill_dir) if target_skill_dir.exists() else []
+    shutil.copytree(
+        skill_path,
+        target_skill_dir,
+        dirs_exist_ok=True,
+        copy_function=_copy_function,
+    )
+
+    # Unlink files that a previous version of the skill shipped but the
+    # current one no longer does
+    expected = {row[0] for row in fingerprint}
+    expected.add(_FINGERPRINT_FILE)
+    for rel, _size, _mtime_ns in existing:
+        if rel not in expected:
+            os.unlink(os.path.join(target_skill_dir, rel))
+
+    marker.write_text(json.dumps(fingerprint), encoding="utf-8")
+    return skill_name
 
-    return sorted(skills)
+
+# Matches the description: line of the YAML frontmatter, as bytes so
+# the file head never has to be fully decoded
+_DESC_RE = re.compile(rb"^description:[ \t]*(.*)$", re.MULTILINE)
+
+
+def _read_description(path: Path) -> str:
+    """Read the frontmatter description from a SKILL.md without loading the body.
+
+    Only the first 2 KiB are read and scanned with a precompiled regex,
+    so the cost stays flat no matter how large the skill body grows.
+    """
+    try:
+        with path.open("rb") as f:
+            head = f.read(2048)
+    except OSError:
+        return ""
+    match = _DESC_RE.search(head)
+    return match.group(1).decode("utf-8", "replace").strip() if match else ""
 
 
 def prompt_location() -> str:
@@ -57,13 +203,16 @@ def prompt_location() -> str:
 def get_skill_dir(location: str) -> Path:
     """Get the Claude Code skills directory based on location."""
     if location == "global":
-        return GLOBAL_SKILL_DIR
+        return _global_skill_dir()
     else:
-        return LOCAL_SKILL_DIR
+        return _local_skill_dir()
 
 
 def install(location: str | None = None) -> None:
     """Install all DDD skills to Claude Code."""
+    # concurrent.futures drags in logging; only install() needs it
+    import concurrent.futures
+
     # Step 1: Prompt for location if not specified
     if location is None:
         location = prompt_location()
@@ -72,43 +221,78 @@ def install(location: str | None = None) -> None:
     available_skills = get_available_skills()
 
     if not available_skills:
-        print(f"\nError: No skills found at {SOURCE_SKILLS_DIR}")
+        print(f"\nError: No skills found at {_source_skills_dir()}")
         sys.exit(1)
 
     target_dir = get_skill_dir(location)
-
-    # Check if source and target are the same
-    if SOURCE_SKILLS_DIR.resolve() == target_dir.resolve():
-        print(f"\nSkills already at: {target_dir}")
+    total = len(available_skills)
+
+    # Read each skill's description once up front; both the
+    # already-installed listing and the install summary reuse them
+    descriptions = {
+        skill_path.name: _read_description(skill_path / "SKILL.md")
+        for skill_path in available_skills
+    }
+
+    # Check if source and target are the same; the raw-path compare
+    # short-circuits the common case with zero syscalls, and samefile
+    # catches symlinked layouts without a full realpath walk.
+    source_dir = _source_skills_dir()
+    if os.fspath(source_dir) == os.fspath(target_dir) or (
+        target_dir.exists() and os.path.samefile(source_dir, target_dir)
+    ):
+        lines = [f"\nSkills already at: {target_dir}\n"]
         for skill_path in available_skills:
-            print(f"  ✓ {skill_path.name}")
-        print(f"\n{len(available_skills)} skill(s) available")
+            lines.append(f"  ✓ {skill_path.name}\n")
+            if descriptions[skill_path.name]:
+                lines.append(f"      {descriptions[skill_path.name]}\n")
+        lines.append(f"\n{total} skill(s) available\n")
+        sys.stdout.write("".join(lines))
         return
 
     # Start installation
     print(f"\nInstalling to {target_dir}\n")
 
-    # Create directory if needed
-    target_dir.mkdir(parents=True, exist_ok=True)
-
-    # Install each skill
-    for skill_path in available_skills:
-        skill_name = skill_path.name
-        target_skill_dir = target_dir / skill_name
-
-        # Copy the skill directory
-        if target_skill_dir.exists():
-            shutil.rmtree(target_skill_dir)
-
-        shutil.copytree(skill_path, target_skill_dir)
-        print(f"  ✓ {skill_name}")
+    # Create the target directory; catching FileExistsError avoids an
+    # upfront exists() stat on the common re-install path.
+    try:
+        target_dir.mkdir(parents=True)
+        print(f"Created {target_dir}\n")
+    except FileExistsError:
+        pass
+
+    # Install skills in parallel; copies are independent and I/O-bound,
+    # so threads overlap the syscall latency even under the GIL.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(8, total)
+    ) as executor:
+        futures = [
+            executor.submit(_install_one, skill_path, target_dir)
+            for skill_path in available_skills
+        ]
+        installed_skills = [
+            future.result()
+            for future in concurrent.futures.as_completed(futures)
+        ]
+
+    # Render progress serially so output stays deterministic; batching
+    # the block into one write avoids a flush syscall per line.
+    lines = []
+    for idx, skill_name in enumerate(sorted(installed_skills), 1):
+        lines.append(f"  [{idx}/{total}] ✓ {skill_name}\n")
+        if descriptions[skill_name]:
+            lines.append(f"      {descriptions[skill_name]}\n")
 
     # Show summary
-    print(f"\nInstalled {len(available_skills)} skill(s). Use /{{skill_name}} to run.")
+    lines.append(f"\nInstalled {total} skill(s). Use /{{skill_name}} to run.\n")
+    sys.stdout.write("".join(lines))
+    sys.stdout.flush()
 
 
 def uninstall(location: str | None = None) -> None:
     """Uninstall all DDD skills from Claude Code."""
+    import shutil
+
     if location is None:
         location = prompt_location()
 
@@ -125,13 +309,24 @@ def uninstall(location: str | None = None) -> None:
 
     print(f"\nUninstalling from {skill_dir}\n")
 
+    # One scandir pass tells us which skills are installed, instead of
+    # an exists() stat per skill
+    try:
+        with os.scandir(skill_dir) as entries:
+            installed = {
+                entry.name
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+            }
+    except FileNotFoundError:
+        installed = set()
+
     # Remove each DDD skill
     for skill_path in available_skills:
         skill_name = skill_path.name
-        target_skill_dir = skill_dir / skill_name
 
-        if target_skill_dir.exists():
-            shutil.rmtree(target_skill_dir)
+        if skill_name in installed:
+            shutil.rmtree(skill_dir / skill_name)
             print(f"  ✓ {skill_name}")
             removed_count += 1
 
@@ -141,8 +336,10 @@ def uninstall(location: str | None = None) -> None:
         print("\nNo DDD skills were installed")
 
 
-def create_parser() -> argparse.ArgumentParser:
+def create_parser() -> "argparse.ArgumentParser":
     """Create argument parser."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="ddd-skill",
         description="Install or uninstall DDD skills for Claude Code",
@@ -191,8 +388,34 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+# Pre-rendered create_parser().format_help(), so the bare and -h/--help
+# invocations never pay for building the parser and its subparsers
+_HELP = """\
+usage: ddd-skill [-h] {install,uninstall} ...
+
+Install or uninstall DDD skills for Claude Code
+
+positional arguments:
+  {install,uninstall}  Available commands
+    install            Install all DDD skills
+    uninstall          Uninstall all DDD skills
+
+options:
+  -h, --help           show this help message and exit
+"""
+
+
 def main() -> None:
     """CLI entry point."""
+    # Fast path: these invocations only ever print help, so skip the
+    # argparse setup entirely
+    if len(sys.argv) <= 1:
+        print(_HELP, end="")
+        sys.exit(1)
+    if sys.argv[1] in ("-h", "--help"):
+        print(_HELP, end="")
+        sys.exit(0)
+
     parser = create_parser()
     args = parser.parse_args()
 